@@ -830,6 +830,75 @@ class Superlocus(Abstractlocus):
                             self.id, ",".join(self.__retained_sources))
         return new_graph
 
+    def _group_by_intron_chain(self, cds_only=False):
+
+        """
+        Private method to group the multiexonic transcripts of the superlocus
+        by their intron chain. Two transcripts sharing the same key are intersecting
+        exactly the same set of transcripts in is_intersecting, therefore only one
+        representative per group needs to go through the graph-building stages.
+        Monoexonic transcripts, whose intersection depends on their coordinates, are
+        always kept as singletons.
+
+        :param cds_only: boolean flag, as in is_intersecting.
+        :type cds_only: bool
+
+        :returns: a dictionary with the representative IDs as keys and the sets of
+        the other members of each group as values.
+        :rtype: dict
+        """
+
+        groups = collections.OrderedDict()
+        representatives = dict()
+        for tid in sorted(self.transcripts):
+            transcript = self.transcripts[tid]
+            transcript.finalize()
+            if transcript.monoexonic is True:
+                groups[tid] = set()
+                continue
+            if cds_only is True and transcript.is_coding is True:
+                if len(transcript.selected_cds_introns) == 0:
+                    # These transcripts do not intersect even with their twins
+                    groups[tid] = set()
+                    continue
+                key = (transcript.strand,
+                       frozenset(transcript.introns),
+                       frozenset(transcript.selected_cds_introns))
+            else:
+                key = (transcript.strand, frozenset(transcript.introns), None)
+
+            if key in representatives:
+                groups[representatives[key]].add(tid)
+            else:
+                representatives[key] = tid
+                groups[tid] = set()
+
+        return groups
+
+    @staticmethod
+    def _expand_intron_chain_groups(transcript_graph, groups):
+
+        """
+        Private method to put back into the transcript graph the members of each
+        intron chain group, linked to their representative. This is sufficient
+        for find_communities, which only considers the connected components of the graph.
+        Groups whose representative has been discarded during the approximation of
+        complex loci are discarded in their entirety.
+
+        :param transcript_graph: the graph calculated on the representatives.
+        :type transcript_graph: networkx.Graph
+
+        :param groups: the dictionary calculated by _group_by_intron_chain.
+        :type groups: dict
+
+        :rtype: networkx.Graph
+        """
+
+        for representative in list(transcript_graph.nodes()):
+            for tid in groups[representative]:
+                transcript_graph.add_edge(*tuple(sorted([representative, tid])))
+        return transcript_graph
+
     def define_subloci(self):
         """This method will define all subloci inside the superlocus.
         Steps:
@@ -853,11 +922,22 @@ class Superlocus(Abstractlocus):
             return
 
         cds_only = self.json_conf["pick"]["clustering"]["cds_only"]
-        self.logger.debug("Calculating the transcript graph for %d transcripts", len(self.transcripts))
-        transcript_graph = self.define_graph(self.transcripts,
+        if self.json_conf["pick"]["clustering"]["collapse_intron_chains"] is True:
+            chain_groups = self._group_by_intron_chain(cds_only=cds_only)
+            representatives = dict((tid, self.transcripts[tid]) for tid in chain_groups)
+            self.logger.debug("Collapsed %d transcripts into %d intron chain groups for %s",
+                              len(self.transcripts), len(chain_groups), self.id)
+        else:
+            chain_groups = None
+            representatives = self.transcripts
+
+        self.logger.debug("Calculating the transcript graph for %d transcripts", len(representatives))
+        transcript_graph = self.define_graph(representatives,
                                              inters=self.is_intersecting,
                                              cds_only=cds_only)
         transcript_graph = self.__reduce_complex_loci(transcript_graph)
+        if chain_groups is not None:
+            transcript_graph = self._expand_intron_chain_groups(transcript_graph, chain_groups)
         if len(self.transcripts) > len(transcript_graph):
             self.logger.warning("Discarded %d transcripts from %s due to approximation level %d",
                                 len(self.transcripts) - len(transcript_graph),
@@ -184,6 +184,42 @@ Chr1\tfoo\texon\t801\t1000\t.\t-\t.\tID=tminus0:exon1;Parent=tminus0""".split("\
         self.assertEqual(t3.proportion_verified_introns, 0)
         self.assertEqual(t3.proportion_verified_introns_inlocus, 0)
 
+    def test_collapse_intron_chains(self):
+
+        """Check that collapsing transcripts with identical intron chains
+        does not change the subloci which are defined."""
+
+        transcripts = []
+        for tid, exons in [("t1", [(100, 200), (300, 500), (600, 1000)]),
+                           ("t2", [(150, 200), (300, 500), (600, 900)]),
+                           ("t3", [(100, 200), (300, 505), (600, 1000)]),
+                           ("t4", [(2000, 2500), (2600, 3000)]),
+                           ("t5", [(1900, 2500), (2600, 3100)])]:
+            transcript = Transcript()
+            transcript.chrom, transcript.strand, transcript.id = "1", "+", tid
+            transcript.start, transcript.end = exons[0][0], exons[-1][1]
+            transcript.add_exons(exons)
+            transcript.finalize()
+            transcripts.append(transcript)
+
+        results = dict()
+        for collapse in (False, True):
+            jconf = configurator.to_json(None)
+            jconf["pick"]["clustering"]["collapse_intron_chains"] = collapse
+            loc = Superlocus(transcripts[0], json_conf=jconf)
+            for transcript in transcripts[1:]:
+                loc.add_transcript_to_locus(transcript, check_in_locus=False)
+            if collapse is True:
+                groups = loc._group_by_intron_chain()
+                self.assertEqual(len(groups), 3)
+                self.assertEqual(groups["t1"], {"t2"})
+                self.assertEqual(groups["t4"], {"t5"})
+            loc.define_subloci()
+            results[collapse] = sorted(tuple(sorted(subl.transcripts.keys()))
+                                       for subl in loc.subloci)
+
+        self.assertEqual(results[False], results[True])
+
     def test_boolean_requirement(self):
 
         logger = create_null_logger(inspect.getframeinfo(inspect.currentframe())[2])
@@ -232,4 +232,69 @@ class TestMetricsEndDistances(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
+
+class TestMetricCache(unittest.TestCase):
+
+    logger = create_default_logger("Cache")
+    logger.setLevel("ERROR")
+
+    def setUp(self):
+
+        self.tr = Transcript()
+        self.tr.logger = self.logger
+        self.tr.start = 101
+        self.tr.end = 1200
+        self.tr.strand = "+"
+        self.tr.id = "test1"
+        self.tr.parent = "test1.gene"
+        self.tr.add_exons([(101, 300), (501, 800), (1001, 1200)])
+        self.tr.add_exons([(201, 300), (501, 800), (1001, 1101)], features="CDS")
+        self.tr.finalize()
+
+    def test_cached_metrics(self):
+
+        self.assertTrue(Transcript.five_utr_length.cached)
+        self.assertFalse(Transcript.cdna_length.cached)
+        with self.assertRaises(ValueError):
+            Transcript.five_utr_length.cached = "yes"
+
+        self.assertEqual(self.tr.five_utr_length, 100)
+        self.assertEqual(self.tr.three_utr_length, 99)
+        self.assertIn("five_utr_length", self.tr._metric_cache)
+        self.assertIn("three_utr_length", self.tr._metric_cache)
+        self.assertNotIn("cdna_length", self.tr._metric_cache)
+        for metric in Transcript.get_available_metrics():
+            _ = getattr(self.tr, metric)
+
+    def test_invalidation(self):
+
+        self.assertEqual(self.tr.utr_length, 199)
+        self.tr.unfinalize()
+        self.assertEqual(self.tr._metric_cache, dict())
+        self.tr.strip_cds()
+        self.assertEqual(self.tr.utr_length, 0)
+        self.assertEqual(self.tr.five_utr_length, 0)
+
+        self.tr.unfinalize()
+        self.tr.remove_exon((1001, 1200))
+        self.tr.end = 800
+        self.tr.finalize()
+        self.assertEqual(self.tr.exon_num, 2)
+        self.assertEqual(self.tr.max_exon_length, 300)
+
+    def test_orf_change(self):
+
+        self.assertEqual(self.tr.selected_cds_num, 3)
+        self.tr.selected_internal_orf_index = 0
+        self.assertNotIn("selected_cds_num", self.tr._metric_cache)
+        self.assertEqual(self.tr.selected_cds_num, 3)
+
+    def test_copy(self):
+
+        self.assertEqual(self.tr.five_utr_length, 100)
+        copied = self.tr.deepcopy()
+        self.assertEqual(copied._metric_cache, dict())
+        copied.strip_cds()
+        self.assertEqual(copied.five_utr_length, 0)
+        self.assertEqual(self.tr.five_utr_length, 100)
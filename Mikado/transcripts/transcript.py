@@ -99,6 +99,10 @@ class Metric(property):
     - "usable_raw": a boolean flag that indicates whether the metric can be used as
     a raw score in itself. *Only metrics whose possible values are between 0 and 1 can be used
       this way*.
+    - "cached": a boolean flag that indicates whether the value of the metric can be memoised
+    on finalized transcripts. Only metrics which depend exclusively on the structure
+    of the transcript (exons, ORFs, strand) should be cached. The cache of the transcript
+    is invalidated whenever it is unfinalized or its selected ORF or strand are changed.
     """
 
     __category__ = None
@@ -155,7 +159,36 @@ class Metric(property):
                      lambda self, v: self.rtype_setter(v),
                      lambda self: None)
 
-    pass
+    __cached__ = False
+
+    def cached_getter(self):
+
+        return self.__cached__
+
+    def cached_setter(self, boolean):
+        if not isinstance(boolean, bool):
+            raise ValueError("The \"cached\" property must be boolean!")
+        self.__cached__ = boolean
+
+    cached = property(lambda self: self.cached_getter(),
+                      lambda self, v: self.cached_setter(v),
+                      lambda self: None)
+
+    def __get__(self, instance, owner=None):
+
+        if instance is None or self.__cached__ is False:
+            return super().__get__(instance, owner)
+
+        cache = getattr(instance, "_metric_cache", None)
+        if cache is None or instance.finalized is not True:
+            return self.fget(instance)
+
+        name = self.fget.__name__
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = self.fget(instance)
+            return value
 
 
 # noinspection PyPropertyAccess
@@ -251,6 +284,8 @@ class Transcript:
         """
 
         # Mock setting of base hidden variables
+        self._metric_cache = dict()
+        self.__finalized = False
         self.__id = ""
         self._first_phase = None
         self.__logger = None
@@ -467,7 +502,8 @@ class Transcript:
         state = copy.deepcopy(dict((key, val) for key, val in self.__dict__.items()
                                    if key not in ("_Transcript__segmenttree",
                                                   "_Transcript__cds_introntree",
-                                                  "_Transcript__cds_tree")))
+                                                  "_Transcript__cds_tree",
+                                                  "_metric_cache")))
         self.logger = logger
 
         if hasattr(self, "json_conf") and self.json_conf is not None:
@@ -495,6 +531,7 @@ class Transcript:
 
     def __setstate__(self, state):
         self.__dict__.update(state)
+        self._metric_cache = dict()
         self.__cds_tree = IntervalTree()
         self.__segmenttree = IntervalTree()
         self.__cds_introntree = IntervalTree()
@@ -1415,6 +1452,27 @@ class Transcript:
             self.__strand = None
         else:
             raise ValueError("Invalid value for strand: {0}".format(strand))
+        self._metric_cache = dict()
+
+    @property
+    def finalized(self):
+        """
+        Flag which indicates whether the transcript has been finalized.
+        Setting it (in either direction) invalidates the cached metrics.
+
+        :rtype bool
+        """
+        return self.__finalized
+
+    @finalized.setter
+    def finalized(self, value):
+        """
+        Setter for the finalized flag. It resets the cache of the metrics.
+        :param value: boolean flag
+        :type value: bool
+        """
+        self.__finalized = value
+        self._metric_cache = dict()
 
     @property
     def selected_internal_orf(self):
@@ -1523,6 +1581,7 @@ class Transcript:
         :param index:
         :type index: None,int
         """
+        self._metric_cache = dict()
         if index is None:
             self.__max_internal_orf_index = index
             self.__max_internal_orf_length = 0
@@ -1959,6 +2018,7 @@ index {3}, internal ORFs: {4}".format(
 
     combined_utr_length.category = "UTR"
     combined_utr_length.rtype = "int"
+    combined_utr_length.cached = True
 
     @Metric
     def combined_utr_fraction(self):
@@ -2016,6 +2076,7 @@ index {3}, internal ORFs: {4}".format(
 
     selected_cds_num.category = "CDS"
     selected_cds_num.rtype = "int"
+    selected_cds_num.cached = True
 
     @Metric
     def selected_cds_fraction(self):
@@ -2035,6 +2096,7 @@ index {3}, internal ORFs: {4}".format(
 
     highest_cds_exons_num.category = "CDS"
     highest_cds_exons_num.rtype = "int"
+    highest_cds_exons_num.cached = True
 
     @Metric
     def selected_cds_exons_fraction(self):
@@ -2066,6 +2128,7 @@ index {3}, internal ORFs: {4}".format(
 
     highest_cds_exon_number.category = "CDS"
     highest_cds_exon_number.rtype = "int"
+    highest_cds_exon_number.cached = True
 
     @Metric
     def selected_cds_number_fraction(self):
@@ -2085,6 +2148,7 @@ index {3}, internal ORFs: {4}".format(
 
     cds_not_maximal.category = "CDS"
     cds_not_maximal.rtype = "int"
+    cds_not_maximal.cached = True
 
     @Metric
     def cds_not_maximal_fraction(self):
@@ -2098,6 +2162,7 @@ index {3}, internal ORFs: {4}".format(
     cds_not_maximal_fraction.category = "CDS"
     cds_not_maximal_fraction.usable_raw = True
     cds_not_maximal_fraction.rtype = "float"
+    cds_not_maximal_fraction.cached = True
 
     @Metric
     def five_utr_length(self):
@@ -2107,6 +2172,7 @@ index {3}, internal ORFs: {4}".format(
         return sum(utr[1] - utr[0] + 1 for utr in self.five_utr)
 
     five_utr_length.category = "UTR"
+    five_utr_length.cached = True
 
     @Metric
     def five_utr_num(self):
@@ -2115,6 +2181,7 @@ index {3}, internal ORFs: {4}".format(
 
     five_utr_num.category = "UTR"
     five_utr_num.rtype = "int"
+    five_utr_num.cached = True
 
     @Metric
     def five_utr_num_complete(self):
@@ -2124,6 +2191,7 @@ index {3}, internal ORFs: {4}".format(
 
     five_utr_num_complete.category = "UTR"
     five_utr_num_complete.rtype = "int"
+    five_utr_num_complete.cached = True
 
     @Metric
     def three_utr_length(self):
@@ -2134,6 +2202,7 @@ index {3}, internal ORFs: {4}".format(
 
     three_utr_length.__category = "UTR"
     three_utr_length.rtype = "int"
+    three_utr_length.cached = True
 
     @Metric
     def three_utr_num(self):
@@ -2143,6 +2212,7 @@ index {3}, internal ORFs: {4}".format(
 
     three_utr_num.category = "UTR"
     three_utr_num.rtype = "int"
+    three_utr_num.cached = True
 
     @Metric
     def three_utr_num_complete(self):
@@ -2152,6 +2222,7 @@ index {3}, internal ORFs: {4}".format(
 
     three_utr_num_complete.category = "UTR"
     three_utr_num_complete.rtype = "int"
+    three_utr_num_complete.cached = True
 
     @Metric
     def utr_num(self):
@@ -2160,6 +2231,7 @@ index {3}, internal ORFs: {4}".format(
 
     utr_num.category = "UTR"
     utr_num.rtype = "int"
+    utr_num.cached = True
 
     @Metric
     def utr_num_complete(self):
@@ -2169,6 +2241,7 @@ index {3}, internal ORFs: {4}".format(
 
     utr_num_complete.category = "UTR"
     utr_num_complete.rtype = "int"
+    utr_num_complete.cached = True
 
     @Metric
     def utr_fraction(self):
@@ -2187,6 +2260,7 @@ index {3}, internal ORFs: {4}".format(
 
     utr_length.category = "UTR"
     utr_length.rtype = "int"
+    utr_length.cached = True
 
     @Metric
     def has_start_codon(self):
@@ -2333,6 +2407,7 @@ index {3}, internal ORFs: {4}".format(
 
     max_intron_length.category = "Intron"
     max_intron_length.rtype = "int"
+    max_intron_length.cached = True
 
     @Metric
     def min_intron_length(self):
@@ -2343,6 +2418,7 @@ index {3}, internal ORFs: {4}".format(
 
     min_intron_length.category = "Intron"
     min_intron_length.rtype = "int"
+    min_intron_length.cached = True
 
     @Metric
     def start_distance_from_tss(self):
@@ -2367,6 +2443,7 @@ index {3}, internal ORFs: {4}".format(
 
     start_distance_from_tss.category = "CDS"
     start_distance_from_tss.rtype = "int"
+    start_distance_from_tss.cached = True
 
     # pylint: disable=invalid-name
     @Metric
@@ -2392,6 +2469,7 @@ index {3}, internal ORFs: {4}".format(
 
     selected_start_distance_from_tss.category = "CDS"
     selected_start_distance_from_tss.rtype = "int"
+    selected_start_distance_from_tss.cached = True
 
     @Metric
     def source_score(self):
@@ -2436,6 +2514,7 @@ index {3}, internal ORFs: {4}".format(
 
     selected_end_distance_from_tes.category = "CDS"
     selected_end_distance_from_tes.rtype = "int"
+    selected_end_distance_from_tes.cached = True
 
     @Metric
     def selected_end_distance_from_junction(self):
@@ -2475,6 +2554,7 @@ index {3}, internal ORFs: {4}".format(
 
     selected_end_distance_from_junction.category = "CDS"
     selected_end_distance_from_junction.rtype = "int"
+    selected_end_distance_from_junction.cached = True
 
     @Metric
     def end_distance_from_junction(self):
@@ -2516,6 +2596,7 @@ index {3}, internal ORFs: {4}".format(
 
     end_distance_from_junction.category = "CDS"
     end_distance_from_junction.rtype = "int"
+    end_distance_from_junction.cached = True
 
     @Metric
     def end_distance_from_tes(self):
@@ -2546,6 +2627,7 @@ index {3}, internal ORFs: {4}".format(
 
     end_distance_from_tes.category = "CDS"
     end_distance_from_tes.rtype = "int"
+    end_distance_from_tes.cached = True
 
     @Metric
     def combined_cds_intron_fraction(self):
@@ -2916,6 +2998,7 @@ index {3}, internal ORFs: {4}".format(
 
     max_exon_length.category = "cDNA"
     max_exon_length.rtype = "int"
+    max_exon_length.cached = True
 
     @Metric
     def min_exon_length(self):